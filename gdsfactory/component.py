@@ -448,6 +448,33 @@ class ComponentBase:
 
         return self.shapes(layer).insert(polygon)
 
+    def add_polygons(
+        self,
+        polygons: Iterable[np.ndarray | kdb.DPolygon | list[list[float]]],
+        layer: LayerSpec,
+    ) -> None:
+        """Adds several Polygons to the same layer with a single insertion.
+
+        Args:
+            polygons: coordinates of the vertices of each Polygon, or DPolygons.
+            layer: layer spec to add polygons on.
+        """
+        from gdsfactory.pdk import get_layer
+
+        layer = get_layer(layer)
+        dbu = self.kcl.dbu
+        region = kdb.Region()
+
+        for points in polygons:
+            if isinstance(points, kdb.DPolygon):
+                polygon = points
+            else:
+                polygon = kf.kdb.DPolygon()
+                polygon.assign_hull(ensure_tuple_of_tuples(points))
+            region.insert(polygon.to_itype(dbu))
+
+        self.shapes(layer).insert(region)
+
     def add_label(
         self,
         text: str = "hello",
@@ -65,10 +65,11 @@ def bezier(
     c = path.extrude(xs)
     curv = curvature(path_points, t)
     length = path.length()
-    if max(np.abs(curv)) == 0:
+    max_curv = np.abs(curv).max()
+    if max_curv == 0:
         min_bend_radius = np.inf
     else:
-        min_bend_radius = float(gf.snap.snap_to_grid(1 / max(np.abs(curv))))
+        min_bend_radius = float(gf.snap.snap_to_grid(1 / max_curv))
 
     c.info["length"] = length
     c.info["min_bend_radius"] = min_bend_radius
@@ -37,7 +37,6 @@ def coupler90(
 
     """
     c = Component()
-    x = gf.get_cross_section(cross_section, radius=radius)
     xs_bend = cross_section_bend or cross_section
 
     bend90 = gf.get_component(
@@ -52,7 +51,7 @@ def coupler90(
         length=bend90.ports["o2"].dcenter[0] - bend90.ports["o1"].dcenter[0],
     )
     wg_ref = c << straight_component
-    width = x.width
+    width = straight_component.ports["o1"].dwidth
 
     pbw = bend_ref.ports["o1"]
     bend_ref.dmovey(pbw.dy + gap + width)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
+from functools import lru_cache, partial
 
 import numpy as np
 from numpy import ndarray
@@ -11,6 +11,17 @@ from gdsfactory.functions import DEG2RAD, extrude_path
 from gdsfactory.typings import CrossSectionSpec, LayerSpec
 
 
+@lru_cache(maxsize=256)
+def _unit_arc(
+    theta_min: float, theta_max: float, angle_step: float
+) -> tuple[ndarray, ndarray]:
+    """Returns read-only (cos, sin) of the arc angles, shared by all teeth."""
+    theta = np.arange(theta_min, theta_max + angle_step, angle_step) * DEG2RAD
+    cos, sin = np.cos(theta), np.sin(theta)
+    cos.flags.writeable = sin.flags.writeable = False
+    return cos, sin
+
+
 def ellipse_arc(
     a: float,
     b: float,
@@ -33,12 +44,28 @@ def ellipse_arc(
         theta_max: in rad.
         angle_step: in rad.
     """
-    theta = np.arange(theta_min, theta_max + angle_step, angle_step) * DEG2RAD
-    xs = a * np.cos(theta) + x0
-    xs = gf.snap.snap_to_grid(xs)
-    ys = b * np.sin(theta)
-    ys = gf.snap.snap_to_grid(ys)
-    return np.column_stack([xs, ys])
+    cos, sin = _unit_arc(theta_min, theta_max, angle_step)
+    return gf.snap.snap_to_grid(np.column_stack([a * cos + x0, b * sin]))
+
+
+@lru_cache(maxsize=256)
+def _ellipse_parameters(
+    fiber_angle: float, wavelength: float, neff: float, nclad: float
+) -> tuple[float, float, float]:
+    """Returns grating ellipse parameters (a1, b1, x1) rounded to 1nm.
+
+    Args:
+        fiber_angle: fibre angle in degrees.
+        wavelength: grating transmission central wavelength (um).
+        neff: tooth effective index.
+        nclad: cladding effective index.
+    """
+    sthc = np.sin(fiber_angle * DEG2RAD)
+    d = neff**2 - nclad**2 * sthc**2
+    a1 = wavelength * neff / d
+    b1 = wavelength / np.sqrt(d)
+    x1 = wavelength * nclad * sthc / d
+    return round(a1, 3), round(b1, 3), round(x1, 3)
 
 
 def grating_tooth_points(
@@ -81,9 +108,8 @@ def grating_taper_points(
         angle_step=angle_step,
     )
 
-    port_position = np.array((x0, 0))
-    p0 = port_position + (0, wg_width / 2)
-    p1 = port_position + (0, -wg_width / 2)
+    p0 = (x0, wg_width / 2)
+    p1 = (x0, -wg_width / 2)
     return np.vstack([p0, p1, taper_arc])
 
 
@@ -143,17 +169,7 @@ def grating_coupler_elliptical(
     wg_width = xs.width
     layer = xs.layer
 
-    # Compute some ellipse parameters
-    sthc = np.sin(fiber_angle * DEG2RAD)
-    d = neff**2 - nclad**2 * sthc**2
-    a1 = wavelength * neff / d
-    b1 = wavelength / np.sqrt(d)
-    x1 = wavelength * nclad * sthc / d
-
-    a1 = round(a1, 3)
-    b1 = round(b1, 3)
-    x1 = round(x1, 3)
-
+    a1, b1, x1 = _ellipse_parameters(fiber_angle, wavelength, neff, nclad)
     period = a1 + x1
 
     c = gf.Component()
@@ -180,15 +196,16 @@ def grating_coupler_elliptical(
     width = gf.snap.snap_to_grid(grating_line_width)
     gap = gf.snap.snap_to_grid(period - grating_line_width)
 
-    xi = taper_length
-    for p in range(n_periods):
-        xi += gap + width / 2
-        p = xi / period
-        pts = grating_tooth_points(
-            p * a1, p * b1, p * x1, width, taper_angle, spiked=spiked
-        )
-        c.add_polygon(pts, layer)
-        xi += width / 2
+    # middle of each tooth: running sum of taper_length, gap + width/2, width/2, ...
+    steps = np.tile((width / 2, gap + width / 2), n_periods)
+    steps[:1] = taper_length
+    xis = np.cumsum(steps)[1::2]
+    ps = xis / period
+    teeth = [
+        grating_tooth_points(a, b, x, width, taper_angle, spiked=spiked)
+        for a, b, x in zip(ps * a1, ps * b1, ps * x1)
+    ]
+    c.add_polygons(teeth, layer)
 
     w = 1.0
     total_length = (
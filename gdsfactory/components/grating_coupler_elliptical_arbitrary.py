@@ -39,7 +39,7 @@ def grating_coupler_elliptical_arbitrary(
     it depends on fiber_angle (degrees), neff, and nclad
 
     Args:
-        gaps: list of gaps.
+        gaps: list of gaps, can have a trailing gap after the last width.
         widths: list of widths.
         taper_length: taper length from input.
         taper_angle: grating flare angle.
@@ -89,25 +89,28 @@ def grating_coupler_elliptical_arbitrary(
     c.info["wavelength"] = wavelength
 
     # get the physical parameters needed to compute ellipses
+    if len(gaps) < len(widths):
+        raise ValueError(
+            f"Need a gap for every width, got {len(gaps)} gaps and {len(widths)} widths"
+        )
     gaps = gf.snap.snap_to_grid(np.array(gaps) + bias_gap)
     widths = gf.snap.snap_to_grid(np.array(widths) - bias_gap)
-    periods = [g + w for g, w in zip(gaps, widths)]
-    neffs = [wavelength / p + nclad * sthc for p in periods]
-    ds = [neff**2 - nclad**2 * sthc**2 for neff in neffs]
-    a1s = [round(wavelength * neff / d, 3) for neff, d in zip(neffs, ds)]
-    b1s = [round(wavelength / np.sqrt(d), 3) for d in ds]
-    x1s = [round(wavelength * nclad * sthc / d, 3) for d in ds]
-    xis = np.add(
-        taper_length + np.cumsum(periods), -widths / 2
-    )  # position of middle of each tooth
-    ps = np.divide(xis, periods)
+    # one tooth per width, trailing gaps (lumerical convention) only extend the taper
+    periods = gaps[: len(widths)] + widths
+    neffs = wavelength / periods + nclad * sthc
+    ds = neffs**2 - nclad**2 * sthc**2
+    a1s = np.round(wavelength * neffs / ds, 3)
+    b1s = np.round(wavelength / np.sqrt(ds), 3)
+    x1s = np.round(wavelength * nclad * sthc / ds, 3)
+    xis = taper_length + np.cumsum(periods) - widths / 2  # middle of each tooth
+    ps = xis / periods
 
     # grating teeth
-    for a1, b1, x1, p, width in zip(a1s, b1s, x1s, ps, widths):
-        pts = grating_tooth_points(
-            p * a1, p * b1, p * x1, width, taper_angle, spiked=spiked
-        )
-        c.add_polygon(pts, layer_grating)
+    teeth = [
+        grating_tooth_points(a, b, x, width, taper_angle, spiked=spiked)
+        for a, b, x, width in zip(ps * a1s, ps * b1s, ps * x1s, widths)
+    ]
+    c.add_polygons(teeth, layer_grating)
 
     # taper
     p = taper_length / periods[0]  # (gaps[0]+widths[0])
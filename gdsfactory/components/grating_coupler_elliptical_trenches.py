@@ -6,8 +6,10 @@ import numpy as np
 
 import gdsfactory as gf
 from gdsfactory.component import Component
-from gdsfactory.components.grating_coupler_elliptical import grating_tooth_points
-from gdsfactory.functions import DEG2RAD
+from gdsfactory.components.grating_coupler_elliptical import (
+    _ellipse_parameters,
+    grating_tooth_points,
+)
 from gdsfactory.typings import CrossSectionSpec, LayerSpec
 
 
@@ -66,32 +68,24 @@ def grating_coupler_elliptical_trenches(
     wg_width = xs.width
     layer = xs.layer
 
-    # Compute some ellipse parameters
-    sthc = np.sin(fiber_angle * DEG2RAD)
-    d = neff**2 - ncladding**2 * sthc**2
-    a1 = wavelength * neff / d
-    b1 = wavelength / np.sqrt(d)
-    x1 = wavelength * ncladding * sthc / d
-
-    a1 = round(a1, 3)
-    b1 = round(b1, 3)
-    x1 = round(x1, 3)
-
+    a1, b1, x1 = _ellipse_parameters(fiber_angle, wavelength, neff, ncladding)
     period = float(a1 + x1)
     trench_line_width = period - grating_line_width
 
     c = gf.Component()
 
     # Make each grating line
-    for p in range(p_start, p_start + n_periods + 1):
-        pts = grating_tooth_points(
+    trenches = [
+        grating_tooth_points(
             p * a1,
             p * b1,
             p * x1,
             width=trench_line_width,
             taper_angle=taper_angle + trenches_extra_angle,
         )
-        c.add_polygon(pts, layer_trench)
+        for p in range(p_start, p_start + n_periods + 1)
+    ]
+    c.add_polygons(trenches, layer_trench)
 
     # Make the taper
     p_taper = p_start - 1
@@ -40,11 +40,8 @@ def text(
                 xoffset += 500 * scaling
             elif 33 <= ascii_val <= 126:
                 for poly in _glyph[ascii_val]:
-                    xpts = np.array(poly)[:, 0] * scaling
-                    ypts = np.array(poly)[:, 1] * scaling
-                    label.add_polygon(
-                        list(zip(xpts + xoffset, ypts + yoffset)), layer=layer
-                    )
+                    points = np.array(poly) * scaling + (xoffset, yoffset)
+                    label.add_polygon(points, layer=layer)
                 xoffset += (_width[ascii_val] + _indent[ascii_val]) * scaling
             else:
                 raise ValueError(f"No character with ascii value {ascii_val!r}")
@@ -51,9 +51,7 @@ def text_freetype(
                     xoffset += 500 * scaling
                 elif (33 <= ascii_val <= 126) or (ascii_val == 181):
                     for poly in _glyph[ascii_val]:
-                        xpts = np.array(poly)[:, 0] * scaling + xoffset
-                        ypts = np.array(poly)[:, 1] * scaling + yoffset
-                        points = list(zip(xpts, ypts))
+                        points = np.array(poly) * scaling + (xoffset, yoffset)
                         char.add_polygon(points, layer=layer)
                     xoffset += (_width[ascii_val] + _indent[ascii_val]) * scaling
                 else:
@@ -241,7 +241,7 @@ def snap_angle(a: float64) -> int:
 
 def angles_rad(pts: ndarray) -> ndarray:
     """Returns the angles (radians) of the connection between each point and the next."""
-    _pts = np.roll(pts, -1, 0)
+    _pts = np.concatenate((pts[1:], pts[:1]))
     return np.arctan2(_pts[:, 1] - pts[:, 1], _pts[:, 0] - pts[:, 0])
 
 
@@ -280,7 +280,8 @@ def extrude_path(
     if isinstance(points, list):
         points = np.stack([(p[0], p[1]) for p in points], axis=0)
 
-    a = angles_deg(points)
+    a_rad = angles_rad(points)
+    a = a_rad * RAD2DEG
     if with_manhattan_facing_angles:
         _start_angle = snap_angle(a[0] + 180)
         _end_angle = snap_angle(a[-2])
@@ -291,8 +292,8 @@ def extrude_path(
     start_angle = start_angle if start_angle is not None else _start_angle
     end_angle = end_angle if end_angle is not None else _end_angle
 
-    a2 = angles_rad(points) * 0.5
-    a1 = np.roll(a2, 1)
+    a2 = a_rad * 0.5
+    a1 = np.concatenate((a2[-1:], a2[:-1]))
 
     a2[-1] = end_angle * DEG2RAD - a2[-2]
     a1[0] = start_angle * DEG2RAD - a1[1]
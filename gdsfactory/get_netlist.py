@@ -19,13 +19,12 @@ Assumes two ports are connected when they have same width, x, y
 
 from __future__ import annotations
 
+import math
 from collections import defaultdict
 from collections.abc import Callable
 from pprint import pprint
 from typing import Any
 
-import numpy as np
-
 from gdsfactory import Port
 from gdsfactory.component import Component, ComponentReference
 from gdsfactory.name import clean_name
@@ -454,7 +453,8 @@ def validate_optical_connection(
                 )
             )
 
-    offset_mismatch = np.sqrt(np.sum(np.square(np.array(port2.center) - port1.center)))
+    (x1, y1), (x2, y2) = port1.center, port2.center
+    offset_mismatch = math.hypot(x2 - x1, y2 - y1)
     if offset_mismatch > offset_tolerance:
         warnings["offset_mismatch"].append(
             _make_warning(
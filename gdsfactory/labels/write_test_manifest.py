@@ -1,14 +1,23 @@
 """Converts CSV of test site labels into a CSV test manifest."""
 
 import csv
-import json
 import pathlib
+from typing import Any
+
+import orjson
 
 import gdsfactory as gf
 from gdsfactory.samples.sample_reticle import sample_reticle
+from gdsfactory.serialization import clean_value_json
 from gdsfactory.typings import Iterable
 
 
+def _dumps(value: Any) -> str:
+    return orjson.dumps(
+        value, option=orjson.OPT_SERIALIZE_NUMPY, default=clean_value_json
+    ).decode()
+
+
 def write_test_manifest(
     component: gf.Component,
     csvpath: str | pathlib.Path,
@@ -62,8 +71,8 @@ def write_test_manifest(
                     _c.name,
                     disp.x,
                     disp.y,
-                    json.dumps(_c.info.model_dump()),
-                    json.dumps(ports),
+                    _dumps(_c.info.model_dump()),
+                    _dumps(ports),
                     analysis,
                     analysis_parameters,
                 ]
@@ -1320,7 +1320,7 @@ def arc(
     )
     x = radius * np.cos(t)
     y = radius * (np.sin(t) + 1)
-    points = np.array((x, y)).T * np.sign(angle)
+    points = np.array((x, y)).T * math.copysign(1, angle)
 
     P = Path()
     # Manually add points & adjust start and end angles
@@ -781,10 +781,8 @@ def _load_yaml_str(yaml_str: Any) -> dict:
         dct = deepcopy(yaml_str.model_dump())
     elif (isinstance(yaml_str, str) and "\n" in yaml_str) or isinstance(yaml_str, IO):
         dct = yaml.safe_load(yaml_str)
-    elif isinstance(yaml_str, str):
-        dct = yaml.safe_load(open(yaml_str))
-    elif isinstance(yaml_str, pathlib.Path):
-        dct = yaml.safe_load(open(yaml_str))
+    elif isinstance(yaml_str, str | pathlib.Path):
+        dct = yaml.safe_load(pathlib.Path(yaml_str).read_bytes())
     else:
         raise ValueError("Invalid format for 'yaml_str'.")
     return dct
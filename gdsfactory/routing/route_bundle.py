@@ -15,6 +15,7 @@ from __future__ import annotations
 from functools import partial
 
 import kfactory as kf
+import numpy as np
 from kfactory.routing.optical import OpticalManhattanRoute
 
 import gdsfactory as gf
@@ -48,33 +49,17 @@ def get_min_spacing(
 
     """
     axis = "X" if ports1[0].orientation in [0, 180] else "Y"
-    j = 0
-    min_j = 0
-    max_j = 0
+    get_port_xy = get_port_y if axis == "X" else get_port_x
+    xs1 = np.fromiter(map(get_port_xy, ports1), dtype=np.float64)
+    xs2 = np.fromiter(map(get_port_xy, ports2), dtype=np.float64)
     if sort_ports:
-        if axis in {"X", "x"}:
-            sorted(ports1, key=get_port_y)
-            sorted(ports2, key=get_port_y)
-        else:
-            sorted(ports1, key=get_port_x)
-            sorted(ports2, key=get_port_x)
-
-    for port1, port2 in zip(ports1, ports2):
-        if axis in {"X", "x"}:
-            x1 = get_port_y(ports1)
-            x2 = get_port_y(port2)
-        else:
-            x1 = get_port_x(port1)
-            x2 = get_port_x(port2)
-        if x2 >= x1:
-            j += 1
-        else:
-            j -= 1
-        if j < min_j:
-            min_j = j
-        if j > max_j:
-            max_j = j
-    j = 0
+        xs1.sort()
+        xs2.sort()
+
+    n = min(len(xs1), len(xs2))
+    j = np.cumsum(np.where(xs2[:n] >= xs1[:n], 1, -1))
+    min_j = int(j.min(initial=0))
+    max_j = int(j.max(initial=0))
 
     return (max_j - min_j) * separation + 2 * radius + 1.0
 
@@ -9,6 +9,7 @@ import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.port import Port, flipped
 from gdsfactory.routing.route_single import OpticalManhattanRoute, route_single
+from gdsfactory.routing.utils import get_ports_xy
 
 
 def sort_key_west_to_east(port: Port) -> float:
@@ -165,10 +166,20 @@ def route_ports_to_x(
     4. north ports
 
     """
-    north_ports = [p for p in list_ports if p.orientation == 90]
-    south_ports = [p for p in list_ports if p.orientation == 270]
-    east_ports = [p for p in list_ports if p.orientation == 0]
-    west_ports = [p for p in list_ports if p.orientation == 180]
+    north_ports = []
+    south_ports = []
+    east_ports = []
+    west_ports = []
+    for p in list_ports:
+        orientation = p.orientation
+        if orientation == 90:
+            north_ports.append(p)
+        elif orientation == 270:
+            south_ports.append(p)
+        elif orientation == 0:
+            east_ports.append(p)
+        elif orientation == 180:
+            west_ports.append(p)
 
     y0_bottom = round(y0_bottom / component.kcl.dbu) if y0_bottom else None
     y0_top = round(y0_top / component.kcl.dbu) if y0_top else None
@@ -185,38 +196,38 @@ def route_ports_to_x(
     bx = epsilon + max(radius, dx_start) if dx_start else a
     by = epsilon + max(radius, dy_start) if dy_start else a
 
-    xs = [p.dx for p in list_ports]
-    ys = [p.dy for p in list_ports]
+    xs, ys = get_ports_xy(list_ports).T
+    min_x, max_x = xs.min(), xs.max()
 
     if y0_bottom is None:
-        y0_bottom = min(ys) - by
+        y0_bottom = ys.min() - by
 
     y0_bottom -= extend_bottom
 
     if y0_top is None:
-        y0_top = max(ys) + (max(radius, dy_start) if dy_start else a)
+        y0_top = ys.max() + (max(radius, dy_start) if dy_start else a)
     y0_top += extend_top
 
     if x == "west" and extension_length > 0:
         extension_length = -extension_length
 
     if x == "east":
-        x = max(p.dx for p in list_ports) + bx
+        x = max_x + bx
     elif x == "west":
-        x = min(p.dx for p in list_ports) - bx
+        x = min_x - bx
     elif isinstance(x, float | int):
         pass
     else:
         raise ValueError(f"x={x!r} should be a float or east or west")
 
-    if x < min(xs):
+    if x < min_x:
         sort_key_north = sort_key_west_to_east
         sort_key_south = sort_key_west_to_east
         forward_ports = west_ports
         backward_ports = east_ports
         angle = 0
 
-    elif x > max(xs):
+    elif x > max_x:
         sort_key_south = sort_key_east_to_west
         sort_key_north = sort_key_east_to_west
         forward_ports = east_ports
@@ -276,8 +287,6 @@ def route_ports_to_x(
         y_optical_top += separation
 
     start_straight_length_section = start_straight_length
-    max_x = max(xs)
-    min_x = min(xs)
 
     for p in backward_ports_thru_north:
         # Extend ports if necessary
@@ -382,18 +391,20 @@ def route_ports_to_y(
         extension_length = -extension_length
 
     da = 45
-    north_ports = [
-        p for p in list_ports if p.orientation > 90 - da and p.orientation < 90 + da
-    ]
-    south_ports = [
-        p for p in list_ports if p.orientation > 270 - da and p.orientation < 270 + da
-    ]
-    east_ports = [
-        p for p in list_ports if p.orientation < da or p.orientation > 360 - da
-    ]
-    west_ports = [
-        p for p in list_ports if p.orientation < 180 + da and p.orientation > 180 - da
-    ]
+    north_ports = []
+    south_ports = []
+    east_ports = []
+    west_ports = []
+    orientations = np.array([p.orientation for p in list_ports])
+    for p, orientation in zip(list_ports, orientations):
+        if 90 - da < orientation < 90 + da:
+            north_ports.append(p)
+        elif 270 - da < orientation < 270 + da:
+            south_ports.append(p)
+        elif orientation < da or orientation > 360 - da:
+            east_ports.append(p)
+        elif 180 - da < orientation < 180 + da:
+            west_ports.append(p)
 
     x0_right = round(x0_right / component.kcl.dbu) if x0_right else None
     x0_left = round(x0_left / component.kcl.dbu) if x0_left else None
@@ -410,43 +421,30 @@ def route_ports_to_y(
     bx = epsilon + max(radius, dx_start) if dx_start else a
     by = epsilon + max(radius, dy_start) if dy_start else a
 
-    xs = [p.dx for p in list_ports]
-    ys = [p.dy for p in list_ports]
+    xs, ys = get_ports_xy(list_ports).T
 
     if x0_left is None:
-        x0_left = min(xs) - bx
+        x0_left = xs.min() - bx
     x0_left -= extend_left
 
     if x0_right is None:
-        x0_right = max(xs) + (max(radius, dx_start) if dx_start else a)
+        x0_right = xs.max() + (max(radius, dx_start) if dx_start else a)
     x0_right += extend_right
 
     if y == "north":
-        y = (
-            max(
-                p.dy + a * np.abs(np.cos(p.orientation * np.pi / 180))
-                for p in list_ports
-            )
-            + by
-        )
+        y = np.max(ys + a * np.abs(np.cos(orientations * np.pi / 180))) + by
     elif y == "south":
-        y = (
-            min(
-                p.dy - a * np.abs(np.cos(p.orientation * np.pi / 180))
-                for p in list_ports
-            )
-            - by
-        )
+        y = np.min(ys - a * np.abs(np.cos(orientations * np.pi / 180))) - by
     elif isinstance(y, float | int):
         pass
-    if y <= min(ys):
+    if y <= ys.min():
         sort_key_east = sort_key_south_to_north
         sort_key_west = sort_key_south_to_north
         forward_ports = south_ports
         backward_ports = north_ports
         angle = 90.0
 
-    elif y >= max(ys):
+    elif y >= ys.max():
         sort_key_west = sort_key_north_to_south
         sort_key_east = sort_key_north_to_south
         forward_ports = north_ports
@@ -477,7 +475,8 @@ def route_ports_to_y(
         new_port.orientation = angle
         new_port.center = (x, y + extension_length)
 
-        if np.sum(np.abs((np.array(new_port.center) - p.center) ** 2)) < 1e-12:
+        (x1, y1), (x2, y2) = new_port.center, p.center
+        if (x1 - x2) ** 2 + (y1 - y2) ** 2 < 1e-12:
             l_ports += [flipped(new_port)]
             return
 
@@ -28,6 +28,7 @@ To generate a route:
 from __future__ import annotations
 
 import kfactory as kf
+import numpy as np
 from kfactory.routing.electrical import route_elec
 from kfactory.routing.optical import OpticalManhattanRoute, place90, route
 
@@ -104,7 +105,12 @@ def route_single(
     radius = radius or xs.radius
     width_dbu = width / component.kcl.dbu
 
-    taper_cell = gf.get_component(taper, cross_section=cross_section) if taper else None
+    if not taper:
+        taper_cell = None
+    elif isinstance(taper, Component):
+        taper_cell = taper
+    else:
+        taper_cell = gf.get_component(taper, cross_section=cross_section)
     bend90 = (
         bend
         if isinstance(bend, Component)
@@ -132,7 +138,7 @@ def route_single(
     if waypoints is not None:
         if not isinstance(waypoints[0], kf.kdb.Point):
             w = [kf.kdb.Point(*p1.center)]
-            w += [kf.kdb.Point(p[0] / dbu, p[1] / dbu) for p in waypoints]
+            w += [kf.kdb.Point(x, y) for x, y in np.asarray(waypoints) / dbu]
             w += [kf.kdb.Point(*p2.center)]
             waypoints = w
 
@@ -86,10 +86,10 @@ def route_single_from_steps(
     """
     x, y = port1.dcenter
 
-    waypoints = []
     steps = steps or []
+    waypoints = np.empty((len(steps), 2))
 
-    for d in steps:
+    for i, d in enumerate(steps):
         if not STEP_DIRECTIVES.issuperset(d):
             invalid_step_directives = list(set(d.keys()) - STEP_DIRECTIVES)
             raise ValueError(
@@ -100,9 +100,7 @@ def route_single_from_steps(
         x += d.get("dx", 0)
         y = d["y"] if "y" in d else y
         y += d.get("dy", 0)
-        waypoints += [(x, y)]
-
-    waypoints = np.array(waypoints)
+        waypoints[i] = x, y
 
     if isinstance(cross_section, list | tuple):
         xs_list = []
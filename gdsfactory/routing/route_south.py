@@ -108,10 +108,17 @@ def route_south(
     if not optical_ports:
         return [], []
 
+    # resolve the taper once, the same way route_single would for every port
+    taper_route = (
+        taper
+        if not taper or isinstance(taper, Component)
+        else gf.get_component(taper, cross_section=cross_section)
+    )
+
     conn_params = dict(
         bend=bend,
         straight=straight,
-        taper=taper,
+        taper=taper_route,
         cross_section=cross_section,
         port_type=port_type,
         allow_width_mismatch=allow_width_mismatch,
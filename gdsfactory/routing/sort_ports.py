@@ -37,7 +37,8 @@ def sort_ports(
     Args:
         ports1: the starting ports
         ports2: the ending ports
-        enforce_port_ordering: if True, only ports2 will be sorted in accordance with ports1.
+        enforce_port_ordering: if True, ports1 is sorted and ports2 follows the same
+            permutation, keeping each (ports1[i], ports2[i]) pair together.
             If False, the two lists will be sorted independently.
 
     """
@@ -51,29 +52,20 @@ def sort_ports(
     if not ports2:
         raise ValueError("ports2 is an empty list")
 
-    if ports1[0].orientation in [0, 180] and ports2[0].orientation in [0, 180]:
-        _sort(get_port_y, ports1, enforce_port_ordering, ports2)
-    elif ports1[0].orientation in [90, 270] and ports2[0].orientation in [90, 270]:
-        _sort(get_port_x, ports1, enforce_port_ordering, ports2)
-    else:
-        axis = "X" if ports1[0].orientation in [0, 180] else "Y"
-        f_key1 = get_port_y if axis in {"X", "x"} else get_port_x
-        ports1.sort(key=f_key1)
-        if not enforce_port_ordering:
-            ports2.sort(key=f_key1)
+    # horizontal ports are stacked along y, vertical ports along x
+    key = get_port_y if ports1[0].orientation in [0, 180] else get_port_x
 
     if enforce_port_ordering:
-        ports2 = [ports2[ports1.index(p1)] for p1 in ports1]
+        pairs = sorted(zip(ports1, ports2), key=lambda pair: key(pair[0]))
+        ports1 = [p1 for p1, _ in pairs]
+        ports2 = [p2 for _, p2 in pairs]
+    else:
+        ports1.sort(key=key)
+        ports2.sort(key=key)
 
     return ports1, ports2
 
 
-def _sort(key_func, ports1, enforce_port_ordering, ports2):
-    ports1.sort(key=key_func)
-    if not enforce_port_ordering:
-        ports2.sort(key=key_func)
-
-
 if __name__ == "__main__":
     import gdsfactory as gf
 
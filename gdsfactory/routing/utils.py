@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from operator import attrgetter
+
+import numpy as np
 from numpy import float64
 
 from gdsfactory.port import Port
@@ -9,9 +12,17 @@ class RouteWarning(UserWarning):
     pass
 
 
+_direction_sort_keys = {
+    "E": attrgetter("dy"),
+    "N": attrgetter("dx"),
+    "W": attrgetter("dy"),
+    "S": attrgetter("dx"),
+}
+
+
 def direction_ports_from_list_ports(optical_ports: list[Port]) -> dict[str, list[Port]]:
     """Returns a dict of WENS ports."""
-    direction_ports = {x: [] for x in ["E", "N", "W", "S"]}
+    direction_ports = {x: [] for x in _direction_sort_keys}
     for p in optical_ports:
         orientation = (p.orientation + 360.0) % 360
         if orientation <= 45.0 or orientation >= 315:
@@ -23,16 +34,21 @@ def direction_ports_from_list_ports(optical_ports: list[Port]) -> dict[str, list
         else:
             direction_ports["S"].append(p)
 
-    for direction, list_ports in list(direction_ports.items()):
-        if direction in ["E", "W"]:
-            list_ports.sort(key=lambda p: p.dy)
-
-        if direction in ["S", "N"]:
-            list_ports.sort(key=lambda p: p.dx)
+    for direction, list_ports in direction_ports.items():
+        list_ports.sort(key=_direction_sort_keys[direction])
 
     return direction_ports
 
 
+def get_ports_xy(list_ports: list[Port]) -> np.ndarray:
+    """Returns an (N, 2) array with the center of each port in um."""
+    return np.fromiter(
+        (p.dcenter for p in list_ports),
+        dtype=np.dtype((np.float64, 2)),
+        count=len(list_ports),
+    )
+
+
 def check_ports_have_equal_spacing(list_ports: list[Port]) -> float64:
     """Returns port separation.
 
@@ -45,15 +61,12 @@ def check_ports_have_equal_spacing(list_ports: list[Port]) -> float64:
         raise ValueError("list_ports should not be empty")
 
     orientation = get_list_ports_angle(list_ports)
-    if orientation in [0, 180]:
-        xys = [p.dy for p in list_ports]
-    else:
-        xys = [p.dx for p in list_ports]
+    xys = get_ports_xy(list_ports)[:, 1 if orientation in [0, 180] else 0]
 
-    seps = [round(abs(c2 - c1), 5) for c1, c2 in zip(xys[1:], xys[:-1])]
+    seps = np.round(np.abs(np.diff(xys)), 5)
     different_seps = set(seps)
     if len(different_seps) > 1:
-        raise ValueError("Ports should have the same separation. Got {different_seps}")
+        raise ValueError(f"Ports should have the same separation. Got {different_seps}")
 
     return different_seps.pop()
 
@@ -1,3 +1,5 @@
+import pathlib
+
 from gdsfactory.typings import Layer, PathType
 
 
@@ -40,7 +42,7 @@ def extract_layers(input_text: str) -> dict[str, Layer]:
 
 def read_from_layers_info(filepath: PathType) -> str:
     """Returns a layermap python script from layers.info file."""
-    input_text = open(filepath).read()
+    input_text = pathlib.Path(filepath).read_text()
     layer_mapping = extract_layers(input_text)
     output = "class LayerMap(BaseModel):\n"
 
@@ -0,0 +1,20 @@
+import pytest
+
+import gdsfactory as gf
+
+
+def test_grating_coupler_elliptical_arbitrary_trailing_gap() -> None:
+    """A trailing gap adds no tooth but still extends a separate-layer taper."""
+    kwargs = dict(widths=(0.5, 0.5), layer_grating="SHALLOW_ETCH")
+    c = gf.components.grating_coupler_elliptical_arbitrary(gaps=(0.1, 0.2), **kwargs)
+    c_trailing = gf.components.grating_coupler_elliptical_arbitrary(
+        gaps=(0.1, 0.2, 0.3), **kwargs
+    )
+    assert c_trailing.dxsize == pytest.approx(c.dxsize + 0.3)
+
+
+def test_grating_coupler_elliptical_arbitrary_missing_gap() -> None:
+    with pytest.raises(ValueError, match="Need a gap for every width"):
+        gf.components.grating_coupler_elliptical_arbitrary(
+            gaps=(0.1, 0.2), widths=(0.5, 0.5, 0.5)
+        )
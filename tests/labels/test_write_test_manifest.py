@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import csv
+import json
+
+import numpy as np
+
+import gdsfactory as gf
+
+
+def test_write_test_manifest_numpy_info(tmp_path) -> None:
+    """Numpy values in info are written as plain JSON numbers."""
+    child = gf.Component()
+    child.add_polygon([(0, 0), (10, 0), (10, 1), (0, 1)], layer=(1, 0))
+    child.info["length"] = np.float64(10.0)
+
+    c = gf.Component()
+    c << child
+
+    csvpath = tmp_path / "test_manifest.csv"
+    gf.labels.write_test_manifest(c, csvpath)
+
+    with open(csvpath) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert json.loads(rows[0]["info"]) == {"length": 10.0}
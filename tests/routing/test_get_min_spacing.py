@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+
+import gdsfactory as gf
+from gdsfactory.routing.route_bundle import get_min_spacing
+
+
+@pytest.mark.parametrize("orientation", [0, 90])
+def test_get_min_spacing(orientation: float) -> None:
+    """Ports fanning out to one side need one separation per crossing."""
+
+    def xy(a: float, b: float) -> tuple[float, float]:
+        return (a, b) if orientation == 90 else (b, a)
+
+    ports1 = [
+        gf.Port(
+            f"o{i}",
+            center=xy(10 * i, 0),
+            width=0.5,
+            orientation=orientation,
+            layer=(1, 0),
+        )
+        for i in range(4)
+    ]
+    ports2 = [
+        gf.Port(
+            f"o{i}",
+            center=xy(10 * i + 5, 100),
+            width=0.5,
+            orientation=orientation + 180,
+            layer=(1, 0),
+        )
+        for i in range(4)
+    ]
+    assert get_min_spacing(ports1, ports2, separation=5, radius=10) == 4 * 5 + 21
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import partial
+
+import pytest
 from pytest_regressions.data_regression import DataRegressionFixture
 
 import gdsfactory as gf
@@ -19,5 +22,15 @@ def test_route_south(
         data_regression.check(lengths)
 
 
+def test_route_south_bend_spec_with_cross_section() -> None:
+    """A bend spec is routed with the cross_section, dy comes from the bare spec."""
+    c = gf.Component()
+    cr = c << gf.components.mmi2x2()
+    xs = partial(gf.cross_section.strip, radius=5)
+    gf.routing.route_south(c, cr, bend="bend_euler", cross_section=xs)
+    assert c.dxsize == pytest.approx(56.0)
+    assert c.dysize == pytest.approx(12.375)
+
+
 if __name__ == "__main__":
     test_route_south(None, check=False)
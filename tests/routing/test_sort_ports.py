@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+import gdsfactory as gf
+from gdsfactory.routing.sort_ports import sort_ports
+
+
+def _ports(positions: list[float], orientation: float, offset: float) -> list[gf.Port]:
+    """Returns ports stacked along y (horizontal ports) or x (vertical ports)."""
+    horizontal = orientation in [0, 180]
+    return [
+        gf.Port(
+            f"o{i}",
+            center=(offset, p) if horizontal else (p, offset),
+            width=0.5,
+            orientation=orientation,
+            layer=(1, 0),
+        )
+        for i, p in enumerate(positions)
+    ]
+
+
+@pytest.mark.parametrize("orientation", [0, 90])
+def test_sort_ports_independent(orientation: float) -> None:
+    axis = 1 if orientation == 0 else 0
+    ports1 = _ports([20, 0, 10], orientation, offset=0)
+    ports2 = _ports([25, 5, 15], orientation + 180, offset=100)
+
+    ports1, ports2 = sort_ports(ports1, ports2, enforce_port_ordering=False)
+    assert [p.dcenter[axis] for p in ports1] == [0, 10, 20]
+    assert [p.dcenter[axis] for p in ports2] == [5, 15, 25]
+
+
+def test_sort_ports_enforce_port_ordering() -> None:
+    """ports2 follows the permutation of ports1 so the pairs are kept."""
+    ports1 = _ports([20, 0, 10], 0, offset=0)
+    ports2 = _ports([5, 15, 25], 180, offset=100)
+    pairs = {p1.name: p2.name for p1, p2 in zip(ports1, ports2)}
+
+    ports1, ports2 = sort_ports(ports1, ports2, enforce_port_ordering=True)
+    assert [p.dcenter[1] for p in ports1] == [0, 10, 20]
+    assert {p1.name: p2.name for p1, p2 in zip(ports1, ports2)} == pairs
+
+
+def test_route_bundle_sbend_keeps_pairs() -> None:
+    """Each sbend ends on the port paired with its start port."""
+    c = gf.Component()
+    ports1 = _ports([20, 0, 10], 0, offset=0)
+    ports2 = _ports([2, 12, 22], 180, offset=50)
+    expected = {(p1.dcenter, p2.dcenter) for p1, p2 in zip(ports1, ports2)}
+
+    gf.routing.route_bundle_sbend(c, ports1, ports2)
+    routed = {(ref.ports["o1"].dcenter, ref.ports["o2"].dcenter) for ref in c.insts}
+    assert routed == expected
@@ -43,3 +43,11 @@ def test_get_polygons():
 
     polygons = c.get_polygons(by="tuple")
     assert (1, 0) in polygons
+
+
+def test_add_polygons() -> None:
+    c = gf.Component()
+    square = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    c.add_polygons([square, gf.kdb.DPolygon(gf.kdb.DBox(2, 0, 3, 1))], layer=(1, 0))
+    polygons = c.get_polygons(by="tuple")
+    assert len(polygons[(1, 0)]) == 2, polygons